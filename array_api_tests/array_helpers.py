@@ -108,7 +108,7 @@ def isnegzero(x):
     dtype = x.dtype
     if dh.is_int_dtype(dtype):
         return false(shape)
-    return equal(divide(one(shape, dtype), x), -infinity(shape, dtype))
+    return equal(divide(one((), dtype), x), -infinity((), dtype))
 
 def isposzero(x):
     """
@@ -119,7 +119,7 @@ def isposzero(x):
     dtype = x.dtype
     if dh.is_int_dtype(dtype):
         return true(shape)
-    return equal(divide(one(shape, dtype), x), infinity(shape, dtype))
+    return equal(divide(one((), dtype), x), infinity((), dtype))
 
 def exactly_equal(x, y):
     """
@@ -206,11 +206,18 @@ def assert_negative(x):
 
 def inrange(x, a, b, epsilon=0, open=False):
     """
-    Returns a mask for values of x in the range [a-epsilon, a+epsilon], inclusive
+    Returns a mask for values of x in the range [a-epsilon, b+epsilon], inclusive
 
-    If open=True, the range is (a-epsilon, a+epsilon) (i.e., not inclusive).
+    If open=True, the range is (a-epsilon, b+epsilon) (i.e., not inclusive).
+
+    a and b can be scalars, in which case they (and epsilon) are used as 0-D
+    arrays that broadcast against x, so no arrays of x's shape are allocated.
     """
-    eps = full(x.shape, epsilon, dtype=x.dtype)
+    if not hasattr(a, "shape"):
+        a = asarray(a, dtype=x.dtype)
+    if not hasattr(b, "shape"):
+        b = asarray(b, dtype=x.dtype)
+    eps = asarray(epsilon, dtype=x.dtype)
     l = less if open else less_equal
     return logical_and(l(a-eps, x), l(x, b+eps))
 
@@ -224,7 +231,7 @@ def isintegral(x):
     if x.dtype in [int8, int16, int32, int64, uint8, uint16, uint32, uint64]:
         return full(x.shape, True, dtype=bool)
     elif x.dtype in [float32, float64]:
-        return equal(remainder(x, one(x.shape, x.dtype)), zero(x.shape, x.dtype))
+        return equal(remainder(x, one((), x.dtype)), zero((), x.dtype))
     else:
         return full(x.shape, False, dtype=bool)
 
@@ -238,15 +245,15 @@ def isodd(x):
     return logical_and(
         isintegral(x),
         equal(
-            remainder(x, 2*one(x.shape, x.dtype)),
-            one(x.shape, x.dtype)))
+            remainder(x, 2*one((), x.dtype)),
+            one((), x.dtype)))
 
 def iseven(x):
     return logical_and(
         isintegral(x),
         equal(
-            remainder(x, 2*one(x.shape, x.dtype)),
-            zero(x.shape, x.dtype)))
+            remainder(x, 2*one((), x.dtype)),
+            zero((), x.dtype)))
 
 def assert_iseven(x):
     """
@@ -269,7 +276,7 @@ def positive_mathematical_sign(x):
     nans, as signed nans are not required by the spec.
 
     """
-    z = zero(x.shape, x.dtype)
+    z = zero((), x.dtype)
     return logical_or(greater(x, z), isposzero(x))
 
 def assert_positive_mathematical_sign(x):
@@ -284,7 +291,7 @@ def negative_mathematical_sign(x):
     nans, as signed nans are not required by the spec.
 
     """
-    z = zero(x.shape, x.dtype)
+    z = zero((), x.dtype)
     if x.dtype in [float32, float64]:
         return logical_or(less(x, z), isnegzero(x))
     return less(x, z)
@@ -301,9 +308,13 @@ def same_sign(x, y):
     have the same sign. The value of this function is False if either x or y
     is nan, as signed nans are not required by the spec.
     """
-    return logical_or(
-        logical_and(positive_mathematical_sign(x), positive_mathematical_sign(y)),
-        logical_and(negative_mathematical_sign(x), negative_mathematical_sign(y)))
+    # Non-nan values have a negative sign exactly when they don't have a
+    # positive sign, so we only need to compare positive signs.
+    same = equal(positive_mathematical_sign(x), positive_mathematical_sign(y))
+    for a in [x, y]:
+        if dh.is_float_dtype(a.dtype):
+            same = logical_and(same, logical_not(isnan(a)))
+    return same
 
 def assert_same_sign(x, y):
     assert all(same_sign(x, y)), "The input arrays do not have the same sign"
@@ -2,7 +2,7 @@ import re
 from collections import defaultdict
 from collections.abc import Mapping
 from functools import lru_cache
-from typing import Any, DefaultDict, Dict, List, NamedTuple, Sequence, Tuple, Union
+from typing import Any, DefaultDict, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
 from warnings import warn
 
 from . import api_version
@@ -74,8 +74,19 @@ class EqualityMapping(Mapping):
                 if key == other_key:
                     raise ValueError(f"Key {key!r} has equality with key {other_key!r}")
         self._key_value_pairs = key_value_pairs
+        # When keys happen to be hashable we can look them up in a dict first,
+        # falling back to linear equality checks only on a miss.
+        try:
+            self._dict: Optional[Dict[Any, Any]] = dict(key_value_pairs)
+        except TypeError:
+            self._dict = None
 
     def __getitem__(self, key):
+        if self._dict is not None:
+            try:
+                return self._dict[key]
+            except (KeyError, TypeError):
+                pass
         for k, v in self._key_value_pairs:
             if key == k:
                 return v
@@ -164,19 +175,22 @@ def is_float_dtype(dtype, *, include_complex=True):
     # See https://github.com/numpy/numpy/issues/18434
     if dtype is None:
         return False
-    valid_dtypes = real_float_dtypes
-    if api_version > "2021.12" and include_complex:
-        valid_dtypes += complex_dtypes
+    # all_float_dtypes already includes complex dtypes when they're supported
+    valid_dtypes = all_float_dtypes if include_complex else real_float_dtypes
     return dtype in valid_dtypes
 
+
+_dtype_to_scalar_type = EqualityMapping(
+    [(d, int) for d in all_int_dtypes]
+    + [(d, float) for d in real_float_dtypes]
+    + [(d, complex) for d in complex_dtypes]
+)
+
+
 def get_scalar_type(dtype: DataType) -> ScalarType:
-    if dtype in all_int_dtypes:
-        return int
-    elif dtype in real_float_dtypes:
-        return float
-    elif dtype in complex_dtypes:
-        return complex
-    else:
+    try:
+        return _dtype_to_scalar_type[dtype]
+    except KeyError:
         return bool
 
 
@@ -139,19 +139,24 @@ class OnewayPromotableDtypes(NamedTuple):
     result_dtype: DataType
 
 
-@composite
 def oneway_promotable_dtypes(
-    draw, dtypes: Sequence[DataType]
-) -> OnewayPromotableDtypes:
+    dtypes: Sequence[DataType],
+) -> SearchStrategy[OnewayPromotableDtypes]:
     """Return a strategy for input dtypes that promote to result dtypes."""
-    d1, d2 = draw(mutually_promotable_dtypes(dtypes=dtypes))
-    result_dtype = dh.result_type(d1, d2)
-    if d1 == result_dtype:
-        return OnewayPromotableDtypes(d2, d1)
-    elif d2 == result_dtype:
-        return OnewayPromotableDtypes(d1, d2)
-    else:
-        reject()
+    dtypes = [d for d in dtypes if not isinstance(d, _UndefinedStub)]
+    assert len(dtypes) > 0, "all dtypes undefined"  # sanity check
+    # Resolve the one-way pairs upfront, rather than promoting (and rejecting
+    # pairs where neither dtype is the result) on every draw.
+    pairs = []
+    for d1, d2 in promotable_dtypes:
+        if d1 not in dtypes or d2 not in dtypes:
+            continue
+        result_dtype = dh.result_type(d1, d2)
+        if d1 == result_dtype:
+            pairs.append(OnewayPromotableDtypes(d2, d1))
+        elif d2 == result_dtype:
+            pairs.append(OnewayPromotableDtypes(d1, d2))
+    return sampled_from(pairs)
 
 
 class OnewayBroadcastableShapes(NamedTuple):
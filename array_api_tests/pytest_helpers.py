@@ -431,17 +431,15 @@ def _real_float_strict_equals(out: Array, expected: Array) -> bool:
     # not that big of a deal for the perf costs.
     if hasattr(_xp, "signbit"):
         out_zero_mask = out == 0
-        out_sign_mask = _xp.signbit(out)
-        out_pos_zero_mask = out_zero_mask & out_sign_mask
-        out_neg_zero_mask = out_zero_mask & ~out_sign_mask
         expected_zero_mask = expected == 0
-        expected_sign_mask = _xp.signbit(expected)
-        expected_pos_zero_mask = expected_zero_mask & expected_sign_mask
-        expected_neg_zero_mask = expected_zero_mask & ~expected_sign_mask
-        pos_zero_match = out_pos_zero_mask == expected_pos_zero_mask
-        neg_zero_match = out_neg_zero_mask == expected_neg_zero_mask
-        if not (xp.all(pos_zero_match) and xp.all(neg_zero_match)):
+        if not xp.all(out_zero_mask == expected_zero_mask):
             return False
+        # Zeros are in the same places, so we only need to compare signs of
+        # zeros - and only if there are any.
+        if xp.any(out_zero_mask):
+            sign_match = _xp.signbit(out) == _xp.signbit(expected)
+            if not xp.all(sign_match | ~out_zero_mask):
+                return False
         ignore_mask |= out_zero_mask
 
     replacement = xp.asarray(42, dtype=out.dtype)  # i.e. an arbitrary non-zero value that equals itself
@@ -450,19 +448,25 @@ def _real_float_strict_equals(out: Array, expected: Array) -> bool:
     return xp.all(match)
 
 
-def _assert_float_element(at_out: Array, at_expected: Array, msg: str):
+def _float_element_matches(at_out: Array, at_expected: Array) -> bool:
     if xp.isnan(at_expected):
-        assert xp.isnan(at_out), msg
+        return bool(xp.isnan(at_out))
     elif at_expected == 0.0 or at_expected == -0.0:
         scalar_at_expected = float(at_expected)
         scalar_at_out = float(at_out)
         if is_pos_zero(scalar_at_expected):
-            assert is_pos_zero(scalar_at_out), msg
+            return is_pos_zero(scalar_at_out)
         else:
             assert is_neg_zero(scalar_at_expected)  # sanity check
-            assert is_neg_zero(scalar_at_out), msg
+            return is_neg_zero(scalar_at_out)
     else:
-        assert at_out == at_expected, msg
+        return bool(at_out == at_expected)
+
+
+def _complex_element_matches(at_out: Array, at_expected: Array) -> bool:
+    return _float_element_matches(
+        xp.real(at_out), xp.real(at_expected)
+    ) and _float_element_matches(xp.imag(at_out), xp.imag(at_expected))
 
 
 def assert_array_elements(
@@ -508,22 +512,16 @@ def assert_array_elements(
     # costly in some array api implementations, so we only do this in the case of a failure.
     msg_template = "{}={}, but should be {} " + f_func
     if out.dtype in dh.real_float_dtypes:
-        for idx in sh.ndindex(out.shape):
-            at_out = out[idx]
-            at_expected = expected[idx]
-            msg = msg_template.format(sh.fmt_idx(out_repr, idx), at_out, at_expected)
-            _assert_float_element(at_out, at_expected, msg)
+        element_matches = _float_element_matches
     elif out.dtype in dh.complex_dtypes:
         assert (out.dtype in dh.complex_dtypes) == (expected.dtype in dh.complex_dtypes)
-        for idx in sh.ndindex(out.shape):
-            at_out = out[idx]
-            at_expected = expected[idx]
-            msg = msg_template.format(sh.fmt_idx(out_repr, idx), at_out, at_expected)
-            _assert_float_element(xp.real(at_out), xp.real(at_expected), msg)
-            _assert_float_element(xp.imag(at_out), xp.imag(at_expected), msg)
+        element_matches = _complex_element_matches
     else:
-        for idx in sh.ndindex(out.shape):
-            at_out = out[idx]
-            at_expected = expected[idx]
-            msg = msg_template.format(sh.fmt_idx(out_repr, idx), at_out, at_expected)
-            assert at_out == at_expected, msg
+        element_matches = lambda at_out, at_expected: bool(at_out == at_expected)
+    for idx in sh.ndindex(out.shape):
+        at_out = out[idx]
+        at_expected = expected[idx]
+        # The message is only formatted for the mismatching element
+        assert element_matches(at_out, at_expected), msg_template.format(
+            sh.fmt_idx(out_repr, idx), at_out, at_expected
+        )
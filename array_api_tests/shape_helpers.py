@@ -1,4 +1,5 @@
 import math
+from functools import lru_cache
 from itertools import product
 from typing import Iterator, List, Optional, Sequence, Tuple, Union
 
@@ -79,21 +80,76 @@ def normalise_axis(
 
 def ndindex(shape: Shape) -> Iterator[Index]:
     """Yield every index of a shape"""
-    return (indices[0] for indices in iter_indices(shape))
+    # A single shape needs no broadcasting, so itertools.product() can generate
+    # its indices directly - faster than even looking them up in a cache.
+    return product(*(range(side) for side in shape))
 
 
-def iter_indices(
+def _generate_indices(
     *shapes: Shape, skip_axes: Tuple[int, ...] = ()
 ) -> Iterator[Tuple[Index, ...]]:
-    """Wrapper for ndindex.iter_indices()"""
     # Prevent iterations if any shape has 0-sides
     for shape in shapes:
         if 0 in shape:
             return
+    if len(skip_axes) == 0 and len(shapes) > 0:
+        if all(shape == shapes[0] for shape in shapes[1:]):
+            # Identical shapes don't broadcast, so each index is used for all
+            # of them
+            n_shapes = len(shapes)
+            for idx in product(*(range(side) for side in shapes[0])):
+                yield (idx,) * n_shapes
+            return
+        # Without skipped axes we can generate indices ourselves from the
+        # broadcasted shape, which is much faster than ndindex.iter_indices()
+        bshape = broadcast_shapes(*shapes)
+        # For each shape, the indices of bshape's axes used to index it, or
+        # None when the shape broadcasts along that axis.
+        axes_maps = []
+        for shape in shapes:
+            offset = len(bshape) - len(shape)
+            axes = [None if side == 1 else offset + i for i, side in enumerate(shape)]
+            axes_maps.append(axes)
+        for b_idx in product(*(range(side) for side in bshape)):
+            yield tuple(
+                tuple(0 if axis is None else b_idx[axis] for axis in axes)
+                for axes in axes_maps
+            )
+        return
     for indices in _iter_indices(*shapes, skip_axes=skip_axes):
         yield tuple(i.raw for i in indices)  # type: ignore
 
 
+# Hypothesis tends to generate the same small shapes across examples, so we
+# cache the indices of small shapes instead of re-generating them every time.
+MAX_CACHED_INDICES = 1000
+
+
+@lru_cache(maxsize=512)
+def _cached_indices(
+    shapes: Tuple[Shape, ...], skip_axes: Tuple[int, ...]
+) -> Tuple[Tuple[Index, ...], ...]:
+    return tuple(_generate_indices(*shapes, skip_axes=skip_axes))
+
+
+def _n_indices(shapes: Tuple[Shape, ...]) -> int:
+    """Upper bound of the number of indices iter_indices() would generate"""
+    n = 1
+    for i in range(1, max((len(s) for s in shapes), default=0) + 1):
+        n *= max(s[-i] for s in shapes if len(s) >= i)
+    return n
+
+
+def iter_indices(
+    *shapes: Shape, skip_axes: Tuple[int, ...] = ()
+) -> Iterator[Tuple[Index, ...]]:
+    """Wrapper for ndindex.iter_indices()"""
+    shapes = tuple(tuple(s) for s in shapes)
+    if _n_indices(shapes) <= MAX_CACHED_INDICES:
+        return iter(_cached_indices(shapes, tuple(skip_axes)))
+    return _generate_indices(*shapes, skip_axes=skip_axes)
+
+
 def axis_ndindex(
     shape: Shape, axis: int
 ) -> Iterator[Tuple[Tuple[Union[int, slice], ...], ...]]:
@@ -2,6 +2,7 @@
 import cmath
 import math
 from collections import Counter, defaultdict
+from typing import Dict
 
 import pytest
 from hypothesis import assume, given
@@ -12,10 +13,20 @@ from . import hypothesis_helpers as hh
 from . import pytest_helpers as ph
 from . import shape_helpers as sh
 from . import xps
+from .typing import Array, Index, Scalar, ScalarType
 
 pytestmark = [pytest.mark.data_dependent_shapes, pytest.mark.unvectorized]
 
 
+def scalars_by_index(x: Array, scalar_type: ScalarType) -> Dict[Index, Scalar]:
+    """Returns each element of x as a Python scalar, keyed by its index.
+
+    Elements are used many times when checking outputs (e.g. out.values can be
+    indexed by every element of out.inverse_indices), so we cast them just once.
+    """
+    return {idx: scalar_type(x[idx]) for idx in sh.ndindex(x.shape)}
+
+
 @given(hh.arrays(dtype=xps.scalar_dtypes(), shape=hh.shapes(min_side=1)))
 def test_unique_all(x):
     out = xp.unique_all(x)
@@ -52,16 +63,16 @@ def test_unique_all(x):
     ), f"{out.counts.shape=}, but should be {out.values.shape=}"
 
     scalar_type = dh.get_scalar_type(out.values.dtype)
+    x_vals = scalars_by_index(x, scalar_type)
+    out_vals = scalars_by_index(out.values, scalar_type)
     counts = defaultdict(int)
     firsts = {}
-    for i, idx in enumerate(sh.ndindex(x.shape)):
-        val = scalar_type(x[idx])
+    for i, val in enumerate(x_vals.values()):
         if counts[val] == 0:
             firsts[val] = i
         counts[val] += 1
 
-    for idx in sh.ndindex(out.indices.shape):
-        val = scalar_type(out.values[idx])
+    for idx, val in out_vals.items():
         if cmath.isnan(val):
             break
         i = int(out.indices[idx])
@@ -73,21 +84,20 @@ def test_unique_all(x):
 
     for idx in sh.ndindex(out.inverse_indices.shape):
         ridx = int(out.inverse_indices[idx])
-        val = out.values[ridx]
-        expected = x[idx]
-        msg = (
+        val = out_vals[(ridx,)]
+        expected = x_vals[idx]
+        if cmath.isnan(expected):
+            matches = cmath.isnan(val)
+        else:
+            matches = val == expected
+        assert matches, (
             f"out.inverse_indices[{idx}]={ridx} results in out.values[{ridx}]={val}, "
             f"but should result in x[{idx}]={expected}"
         )
-        if dh.is_float_dtype(out.values.dtype) and xp.isnan(expected):
-            assert xp.isnan(val), msg
-        else:
-            assert val == expected, msg
 
     vals_idx = {}
     nans = 0
-    for idx in sh.ndindex(out.values.shape):
-        val = scalar_type(out.values[idx])
+    for idx, val in out_vals.items():
         count = int(out.counts[idx])
         if cmath.isnan(val):
             nans += 1
@@ -183,11 +193,12 @@ def test_unique_inverse(x):
         repr_name="out.inverse_indices.shape",
     )
     scalar_type = dh.get_scalar_type(out.values.dtype)
-    distinct = set(scalar_type(x[idx]) for idx in sh.ndindex(x.shape))
+    x_vals = scalars_by_index(x, scalar_type)
+    out_vals = scalars_by_index(out.values, scalar_type)
+    distinct = set(x_vals.values())
     vals_idx = {}
     nans = 0
-    for idx in sh.ndindex(out.values.shape):
-        val = scalar_type(out.values[idx])
+    for idx, val in out_vals.items():
         if cmath.isnan(val):
             nans += 1
         else:
@@ -200,19 +211,18 @@ def test_unique_inverse(x):
             vals_idx[val] = idx
     for idx in sh.ndindex(out.inverse_indices.shape):
         ridx = int(out.inverse_indices[idx])
-        val = out.values[ridx]
-        expected = x[idx]
-        msg = (
+        val = out_vals[(ridx,)]
+        expected = x_vals[idx]
+        if cmath.isnan(expected):
+            matches = cmath.isnan(val)
+        else:
+            matches = val == expected
+        assert matches, (
             f"out.inverse_indices[{idx}]={ridx} results in out.values[{ridx}]={val}, "
             f"but should result in x[{idx}]={expected}"
         )
-        if dh.is_float_dtype(out.values.dtype) and xp.isnan(expected):
-            assert xp.isnan(val), msg
-        else:
-            assert val == expected, msg
     if dh.is_float_dtype(out.values.dtype):
-        assume(math.prod(x.shape) <= 128)  # may not be representable
-        expected = xp.sum(xp.astype(xp.isnan(x), xp.uint8))
+        expected = sum(cmath.isnan(v) for v in x_vals.values())
         assert nans == expected, f"{nans} NaNs in out.values, but should be {expected}"
 
 
@@ -221,7 +231,8 @@ def test_unique_values(x):
     out = xp.unique_values(x)
     ph.assert_dtype("unique_values", in_dtype=x.dtype, out_dtype=out.dtype)
     scalar_type = dh.get_scalar_type(x.dtype)
-    distinct = set(scalar_type(x[idx]) for idx in sh.ndindex(x.shape))
+    x_vals = scalars_by_index(x, scalar_type)
+    distinct = set(x_vals.values())
     vals_idx = {}
     nans = 0
     for idx in sh.ndindex(out.shape):
@@ -235,6 +246,5 @@ def test_unique_values(x):
             ), f"out[{idx}]={val}, but {val} is also in out[{vals_idx[val]}]"
             vals_idx[val] = idx
     if dh.is_float_dtype(out.dtype):
-        assume(math.prod(x.shape) <= 128)  # may not be representable
-        expected = xp.sum(xp.astype(xp.isnan(x), xp.uint8))
+        expected = sum(cmath.isnan(v) for v in x_vals.values())
         assert nans == expected, f"{nans} NaNs in out, but should be {expected}"
@@ -22,6 +22,7 @@ axis has to be pos-or-keyword to support both styles
 """
 from collections import defaultdict
 from copy import copy
+from functools import lru_cache
 from inspect import Parameter, Signature, signature
 from types import FunctionType
 from typing import Any, Callable, Dict, Literal, get_args
@@ -95,6 +96,12 @@ def _test_inspectable_func(sig: Signature, stub_sig: Signature):
         )
 
 
+@lru_cache(maxsize=None)
+def stub_signature(stub: FunctionType) -> Signature:
+    """Returns the signature of a stub, inspecting it only once"""
+    return signature(stub)
+
+
 def make_pretty_func(func_name: str, *args: Any, **kwargs: Any) -> str:
     f_sig = f"{func_name}("
     f_sig += ", ".join(str(a) for a in args)
@@ -147,7 +154,7 @@ matrixy_names = [
 ]
 matrixy_names += ["__matmul__", "triu", "tril"]
 for func_name, func in name_to_func.items():
-    stub_sig = signature(func)
+    stub_sig = stub_signature(func)
     array_argnames = set(stub_sig.parameters.keys()) & {"x", "x1", "x2", "other"}
     if func in array_methods:
         array_argnames.add("self")
@@ -245,7 +252,7 @@ def _test_uninspectable_func(func_name: str, func: Callable, stub_sig: Signature
 
 
 def _test_func_signature(func: Callable, stub: FunctionType, is_method=False):
-    stub_sig = signature(stub)
+    stub_sig = stub_signature(stub)
     # If testing against array, ignore 'self' arg in stub as it won't be present
     # in func (which should be a method).
     if is_method:
@@ -19,6 +19,7 @@ import re
 from dataclasses import dataclass, field
 from decimal import ROUND_HALF_EVEN, Decimal
 from enum import Enum, auto
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple, Literal
 from warnings import warn
 
@@ -66,7 +67,9 @@ def make_rough_eq(v: float) -> UnaryCheck:
     assert math.isfinite(v)  # sanity check
 
     def rough_eq(i: float) -> bool:
-        return math.isclose(i, v, abs_tol=0.01)
+        # Approximated values are small (at most π in magnitude), so just an
+        # absolute tolerance is needed - cheaper than calling math.isclose()
+        return abs(i - v) <= 0.01
 
     return rough_eq
 
@@ -98,7 +101,7 @@ def make_or(cond1: UnaryCheck, cond2: UnaryCheck) -> UnaryCheck:
 
 def make_and(cond1: UnaryCheck, cond2: UnaryCheck) -> UnaryCheck:
     def and_(i: float) -> bool:
-        return cond1(i) or cond2(i)
+        return cond1(i) and cond2(i)
 
     return and_
 
@@ -134,6 +137,9 @@ class ParseError(ValueError):
     value: str
 
 
+# Like conditions (see parse_cond), values are shared by many special cases, so
+# each value string is parsed just once.
+@lru_cache(maxsize=None)
 def parse_value(value_str: str) -> float:
     """
     Parses a value string to return a float, e.g.
@@ -306,6 +312,9 @@ def wrap_strat_as_from_dtype(strat: st.SearchStrategy[float]) -> FromDtypeFunc:
     return from_dtype
 
 
+# The same conditions are used across many special cases (e.g. "``NaN``"), so
+# each condition string is parsed just once.
+@lru_cache(maxsize=None)
 def parse_cond(cond_str: str) -> Tuple[UnaryCheck, str, BoundFromDtype]:
     """
     Parses a Sphinx-formatted condition string to return:
@@ -439,6 +448,8 @@ def parse_cond(cond_str: str) -> Tuple[UnaryCheck, str, BoundFromDtype]:
         return cond, expr_template, BoundFromDtype(kwargs, filter_, from_dtype)
 
 
+# Like conditions, each result string is parsed just once
+@lru_cache(maxsize=None)
 def parse_result(result_str: str) -> Tuple[UnaryCheck, str]:
     """
     Parses a Sphinx-formatted result string to return:
@@ -851,7 +862,7 @@ def make_eq_input_check_result(
 
     """
     if eq_neg:
-        input_wrapper = lambda i: -i
+        input_wrapper = operator.neg
     else:
         input_wrapper = noop
 
@@ -917,7 +928,7 @@ def parse_binary_case(case_str: str) -> BinaryCase:
             shared_from_dtype = lambda d, **kw: st.shared(
                 xps.from_dtype(d, **kw), key=cond_str
             )
-            input_wrapper = lambda i: -i if other_sign == "-" else noop
+            input_wrapper = operator.neg if other_sign == "-" else noop
             if other_no == "1":
 
                 def partial_cond(i1: float, i2: float) -> bool:
@@ -1294,7 +1305,7 @@ def test_iop(iop_name, iop, case, data):
     res_value = float(res)
 
     assert case.check_result(x1_value, x2_value, res_value), (
-        f"x1={res}, but should be {case.result_expr} [{func_name}()]\n"
+        f"x1={res}, but should be {case.result_expr} [{iop_name}()]\n"
         f"condition: {case}\n"
         f"x1={x1_value}, x2={x2_value}"
     )
@@ -35,3 +35,19 @@ def test_iter():
     assert next(it) == "key"
     with pytest.raises(StopIteration):
         next(it)
+
+
+def test_unhashable_keys():
+    class UnhashableEq:
+        __hash__ = None
+
+        def __init__(self, name):
+            self.name = name
+
+        def __eq__(self, other):
+            return isinstance(other, UnhashableEq) and self.name == other.name
+
+    mapping = EqualityMapping([(UnhashableEq("a"), 1), (UnhashableEq("b"), 2)])
+    assert mapping[UnhashableEq("b")] == 2
+    with pytest.raises(KeyError):
+        mapping[UnhashableEq("c")]
@@ -1,6 +1,6 @@
 import math
 
-from array_api_tests .test_special_cases import parse_result
+from array_api_tests .test_special_cases import make_and, make_or, parse_result
 
 
 def test_parse_result():
@@ -8,3 +8,17 @@ def test_parse_result():
         "an implementation-dependent approximation to ``+3π/4``"
     )
     assert check_result(3 * math.pi / 4)
+
+
+def test_make_and():
+    cond = make_and(lambda i: i > 0, lambda i: i < 10)
+    assert cond(5)
+    assert not cond(-5)
+    assert not cond(15)
+
+
+def test_make_or():
+    cond = make_or(lambda i: i < 0, lambda i: i > 10)
+    assert cond(-5)
+    assert cond(15)
+    assert not cond(5)
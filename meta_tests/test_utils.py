@@ -9,7 +9,11 @@ from array_api_tests import shape_helpers as sh
 from array_api_tests import xps
 from array_api_tests .test_creation_functions import frange
 from array_api_tests .test_manipulation_functions import roll_ndindex
-from array_api_tests .test_operators_and_elementwise_functions import mock_int_dtype
+from array_api_tests .test_operators_and_elementwise_functions import (
+    elements_match,
+    isclose,
+    mock_int_dtype,
+)
 
 
 @pytest.mark.parametrize(
@@ -34,6 +38,24 @@ def test_ndindex(shape, expected):
     assert list(sh.ndindex(shape)) == expected
 
 
+@pytest.mark.parametrize(
+    "shapes, expected",
+    [
+        ([(2,), ()], [((0,), ()), ((1,), ())]),
+        ([(2, 1), (1, 0)], []),
+        ([(2,), (2,)], [((0,), (0,)), ((1,), (1,))]),
+        (
+            [(2, 1), (2,)],
+            [((0, 0), (0,)), ((0, 0), (1,)), ((1, 0), (0,)), ((1, 0), (1,))],
+        ),
+    ],
+)
+def test_iter_indices(shapes, expected):
+    assert list(sh.iter_indices(*shapes)) == expected
+    # Indices of small shapes are cached, so check repeated calls too
+    assert list(sh.iter_indices(*shapes)) == expected
+
+
 @pytest.mark.parametrize(
     "shape, axis, expected",
     [
@@ -118,3 +140,14 @@ def test_oneway_promotable_dtypes(D):
 @given(hh.oneway_broadcastable_shapes())
 def test_oneway_broadcastable_shapes(S):
     assert S.result_shape == sh.broadcast_shapes(*S)
+
+
+def test_elements_match_rounded_bound():
+    # The lower bound of e (i.e. e - max(0.25 * |e|, 1)) rounds outward when
+    # cast to float32, to this result which is not close to e
+    e = -1.5885683833831
+    res = xp.asarray(-2.5885684490203857, dtype=xp.float32)
+    M = dh.dtype_ranges[xp.float32].max
+    check = lambda o, e: isclose(o, e, M)
+    assert not check(float(res), e)  # sanity check
+    assert not elements_match(res, check, {(): e})